@@ -4,37 +4,346 @@ import re
 import yaml
 import json
 import shutil
+import errno
+import hashlib
+import tempfile
+import argparse
+import functools
+import importlib.metadata
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from string import Template
 from ghp_import import ghp_import
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+try:
+    import tomllib
+except ImportError:
+    tomllib = None
+
+# Page data saved by --emit-json is serialized with orjson when it is
+# installed. The fallback writes the same 2-space indented UTF-8 so the
+# JSON looks alike either way.
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+MARKDOWN_ENGINES = ('markdown', 'mistune', 'cmarkgfm')
+
+
+def load_markdown_engine(name):
+    """
+    Returns the render function and a name-version tag for one of
+    MARKDOWN_ENGINES. Raises ImportError if that engine is not installed
+    or is too old to use.
+    """
+    if name == 'cmarkgfm':
+        import cmarkgfm
+        from cmarkgfm.cmark import Options as CmarkOptions
+
+        def render(text):
+            # UNSAFE keeps raw HTML in pages, as Python-Markdown does
+            return cmarkgfm.github_flavored_markdown_to_html(text, options=CmarkOptions.CMARK_OPT_UNSAFE)
+
+        return render, f"cmarkgfm-{importlib.metadata.version('cmarkgfm')}"
+
+    if name == 'mistune':
+        import mistune
+        # mistune 0.8 has a different API with no mistune.html
+        if not hasattr(mistune, 'html'):
+            raise ImportError(f"mistune {getattr(mistune, '__version__', '?')} is too old; version 2 or later is needed")
+        return mistune.html, f'mistune-{mistune.__version__}'
+
+    return markdown.markdown, f'markdown-{markdown.__version__}'
+
+
+# Python-Markdown unless --markdown-engine picks another one. MD_ENGINE is
+# mixed into every cache key so that switching or upgrading the engine
+# never serves HTML rendered by another one.
+_render_md, MD_ENGINE = load_markdown_engine('markdown')
+
+# In-process memo of content hash -> HTML, in front of the on-disk cache.
+_md_memo = {}
+
+# json.dumps builds a new encoder per call when given separators, so the
+# compact one used for container groups is built once here.
+_compact_json_encoder = json.JSONEncoder(separators=(',', ':'))
+
+# Set by --yaml-front-matter to send all '---' front matter through PyYAML
+# instead of trying the simple parser first.
+USE_YAML_FRONT_MATTER = False
+
+# What the simple front matter parser accepts: unindented 'key: value'
+# lines whose values are integers, true/false/null, quoted strings
+# without escapes, plain strings that YAML could not read as anything
+# else, or flow lists of those. Anything more goes to PyYAML.
+_FRONT_MATTER_KEY_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+_FRONT_MATTER_INT_RE = re.compile(r'[-+]?(?:0|[1-9][0-9]*)')
+_FRONT_MATTER_PLAIN_RE = re.compile(r'(?:[A-Za-z_]|\.{1,2}/)[A-Za-z0-9 _./-]*')
+_FRONT_MATTER_CONSTANTS = {
+    'true': True, 'True': True, 'TRUE': True,
+    'false': False, 'False': False, 'FALSE': False,
+    'null': None, 'Null': None, 'NULL': None, '~': None,
+}
+# Plain words YAML 1.1 reads as booleans
+_FRONT_MATTER_YAML_WORDS = {'yes', 'Yes', 'YES', 'no', 'No', 'NO', 'on', 'On', 'ON', 'off', 'Off', 'OFF'}
+
+# Compiled templates keyed by path, each stored with the mtime it was read at.
+_template_cache = {}
+
 
 def parse_front_matter(markdown_text):
     """
     Parses YAML front matter and returns metadata and content.
     """
-    front_matter_pattern = r'\A---\s*$(.*?)^\s*---\s*$(.*)'
-    match = re.search(front_matter_pattern, markdown_text, re.MULTILINE | re.DOTALL)
+    metadata, content = _parse_front_matter(markdown_text)
+    # Callers add their own keys, so keep the cached dict untouched
+    return dict(metadata), content
+
+
+def _parse_simple_scalar(value):
+    if value in _FRONT_MATTER_CONSTANTS:
+        return _FRONT_MATTER_CONSTANTS[value]
+    if _FRONT_MATTER_INT_RE.fullmatch(value):
+        return int(value)
+    if len(value) >= 2 and value[0] == value[-1] == '"' and '"' not in value[1:-1] and '\\' not in value:
+        return value[1:-1]
+    if len(value) >= 2 and value[0] == value[-1] == "'" and "'" not in value[1:-1]:
+        return value[1:-1]
+    if (_FRONT_MATTER_PLAIN_RE.fullmatch(value) and not value.endswith(' ')
+            and value not in _FRONT_MATTER_YAML_WORDS):
+        return value
+    raise ValueError(value)
+
+
+def _parse_simple_front_matter(front_matter_str):
+    """
+    Parses the flat 'key: value' front matter used by the pages without a
+    YAML engine. Returns None for anything outside that subset, so the
+    caller can fall back to PyYAML.
+    """
+    metadata = {}
+    for line in front_matter_str.splitlines():
+        if not line.strip() or line.startswith('#'):
+            continue
+
+        key, separator, raw_value = line.partition(':')
+        # YAML only splits on ': '; 'title:Foo' is one plain string
+        if not separator or (raw_value and not raw_value.startswith(' ')):
+            return None
+        # Keys such as 'yes' or 'null' are booleans or None to YAML
+        if (not _FRONT_MATTER_KEY_RE.fullmatch(key)
+                or key in _FRONT_MATTER_CONSTANTS or key in _FRONT_MATTER_YAML_WORDS):
+            return None
+        value = raw_value.strip()
+        if not value:
+            return None
 
-    if match:
-        front_matter_str, content = match.groups()
         try:
-            metadata = yaml.safe_load(front_matter_str) or {}
+            if value[0] == '[' and value[-1] == ']':
+                items = value[1:-1].strip()
+                metadata[key] = [_parse_simple_scalar(item.strip()) for item in items.split(',')] if items else []
+            else:
+                metadata[key] = _parse_simple_scalar(value)
+        except ValueError:
+            return None
+    return metadata
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_front_matter(markdown_text):
+    # Front matter sits between two delimiter lines, '---' for YAML or
+    # '+++' for TOML, so plain string searches are enough to find it
+    delimiter = markdown_text[:3]
+    if delimiter not in ('---', '+++'):
+        return {}, markdown_text
+
+    end = markdown_text.find('\n' + delimiter, 3)
+
+    if end != -1:
+        front_matter_str = markdown_text[3:end]
+        content = markdown_text[end + 4:]
+
+        if delimiter == '+++':
+            if tomllib is None:
+                print("Warning: TOML front matter needs Python 3.11 or later.")
+                return {}, markdown_text
+            try:
+                return tomllib.loads(front_matter_str), content.strip()
+            except tomllib.TOMLDecodeError as e:
+                print(f"Warning: Could not parse TOML front matter. {e}")
+                return {}, markdown_text
+
+        metadata = None if USE_YAML_FRONT_MATTER else _parse_simple_front_matter(front_matter_str)
+        if metadata is not None:
             return metadata, content.strip()
+        try:
+            metadata = yaml.load(front_matter_str, Loader=SafeLoader) or {}
         except yaml.YAMLError as e:
             print(f"Warning: Could not parse YAML front matter. {e}")
             return {}, markdown_text
+        if not isinstance(metadata, dict):
+            print(f"Warning: YAML front matter is a {type(metadata).__name__}, not a mapping. Ignoring it.")
+            return {}, markdown_text
+        return metadata, content.strip()
     return {}, markdown_text
 
 
+def render_markdown(markdown_content, md_cache_dir):
+    """
+    Converts Markdown to HTML, reusing a previous conversion of identical
+    content from the in-process memo or the on-disk cache in md_cache_dir.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(MD_ENGINE.encode('utf-8'))
+    h.update(b'\0')
+    h.update(markdown_content.encode('utf-8'))
+    key = h.hexdigest()
+
+    if key in _md_memo:
+        return _md_memo[key]
+
+    cache_path = os.path.join(md_cache_dir, key)
+    if os.path.exists(cache_path):
+        html_content = read_text(cache_path)
+    else:
+        html_content = _render_md(markdown_content)
+        # Write to a temporary file and rename so a partially written
+        # entry is never picked up by a later build.
+        fd, tmp_path = tempfile.mkstemp(dir=md_cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+        os.replace(tmp_path, cache_path)
+
+    _md_memo[key] = html_content
+    return html_content
+
+
+def clear_cache(md_cache_dir):
+    """
+    Empties the Markdown conversion cache, both in-process and on disk.
+    The directory itself is kept so later conversions can still use it.
+    """
+    _md_memo.clear()
+    if os.path.exists(md_cache_dir):
+        shutil.rmtree(md_cache_dir)
+        print(f"Cleared Markdown cache: '{md_cache_dir}'")
+    create_missing_directory(md_cache_dir)
+
+
 def create_missing_directory(path):
-    if not os.path.exists(path):
-        os.makedirs(path)
-        print(f"Created directory: '{path}'")
+    # Just try to create it: one syscall when it already exists, and no
+    # window between checking and creating
+    try:
+        os.mkdir(path)
+    except FileExistsError:
+        return
+    except FileNotFoundError:
+        os.makedirs(path, exist_ok=True)
+    print(f"Created directory: '{path}'")
+
+
+def _place_static_file(src_path, dst_path, mode):
+    if mode == 'hardlink':
+        try:
+            os.link(src_path, dst_path)
+            return
+        except OSError as e:
+            # Hard links cannot cross filesystems
+            if e.errno != errno.EXDEV:
+                raise
+            mode = 'symlink'
+
+    if mode == 'symlink':
+        os.symlink(os.path.abspath(src_path), dst_path)
+    else:
+        shutil.copy2(src_path, dst_path)
+
+
+def _is_placed_as(src_stat, dst_entry, mode):
+    """
+    Checks that an existing destination file already has the form mode
+    asks for, so switching modes replaces files that are otherwise current.
+    """
+    dst_lstat = dst_entry.stat(follow_symlinks=False)
+    if mode == 'hardlink':
+        # A symlink stands in for a hard link across filesystems
+        return (os.path.samestat(src_stat, dst_lstat)
+                or (dst_entry.is_symlink() and dst_lstat.st_dev != src_stat.st_dev))
+    if mode == 'symlink':
+        return dst_entry.is_symlink()
+    return not dst_entry.is_symlink() and not os.path.samestat(src_stat, dst_lstat)
 
 
-def copy_static_assets(static_src_dirs, output_dir):
+def _sync_static_tree(src_dir, dst_dir, mode):
+    """
+    Mirrors src_dir into dst_dir, leaving files alone whose destination is
+    the same size and at least as new as the source, and removing anything
+    no longer present in src_dir. Returns the (updated, unchanged) counts.
     """
-    Copies a static asset directory to the output directory.
+    create_missing_directory(dst_dir)
+
+    with os.scandir(dst_dir) as it:
+        existing = {entry.name: entry for entry in it}
+
+    updated = unchanged = 0
+    with os.scandir(src_dir) as it:
+        for entry in it:
+            dst_path = os.path.join(dst_dir, entry.name)
+            dst_entry = existing.pop(entry.name, None)
+
+            if entry.is_dir():
+                if dst_entry is not None and not dst_entry.is_dir(follow_symlinks=False):
+                    os.remove(dst_path)
+                sub_updated, sub_unchanged = _sync_static_tree(entry.path, dst_path, mode)
+                updated += sub_updated
+                unchanged += sub_unchanged
+                continue
+
+            if dst_entry is not None:
+                if dst_entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(dst_path)
+                else:
+                    src_stat = entry.stat()
+                    try:
+                        dst_stat = dst_entry.stat()
+                    except FileNotFoundError:
+                        # A symlink whose target has gone
+                        dst_stat = None
+                    if (dst_stat is not None
+                            and _is_placed_as(src_stat, dst_entry, mode)
+                            and dst_stat.st_size == src_stat.st_size
+                            and dst_stat.st_mtime >= src_stat.st_mtime):
+                        unchanged += 1
+                        continue
+                    # Never write through an old link into the source tree
+                    os.remove(dst_path)
+
+            _place_static_file(entry.path, dst_path, mode)
+            updated += 1
+
+    for dst_entry in existing.values():
+        if dst_entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(dst_entry.path)
+        else:
+            os.remove(dst_entry.path)
+
+    return updated, unchanged
+
+
+def copy_static_assets(static_src_dirs, output_dir, mode='copy'):
+    """
+    Copies static asset directories to the output directory, skipping
+    files that are already up to date. mode is 'copy', 'hardlink' or
+    'symlink'; hard links fall back to symlinks across filesystems.
     """
 
     print("\n--- Copying Static Assets ---")
@@ -47,60 +356,168 @@ def copy_static_assets(static_src_dirs, output_dir):
 
         output_static_path = os.path.join(output_dir, os.path.basename(static_src_dir))
 
-        if os.path.exists(output_static_path):
-            shutil.rmtree(output_static_path)
+        if os.path.isfile(output_static_path) or os.path.islink(output_static_path):
+            os.remove(output_static_path)
 
-        shutil.copytree(static_src_dir, output_static_path)
-        print(f"Copied '{static_src_dir}' -> '{output_static_path}'")
+        updated, unchanged = _sync_static_tree(static_src_dir, output_static_path, mode)
+        print(f"Copied '{static_src_dir}' -> '{output_static_path}' ({updated} updated, {unchanged} unchanged)")
 
 
-def generate_navigation_links(input_dir, navigation_links_list):
-    # Generate Navigation Links
-    for filename in os.listdir(input_dir):
-        if not filename.endswith(('.md', '.markdown')):
-            continue
+def scan_directory(path, extensions):
+    """
+    Splits the entries of path into subdirectories and files ending in one
+    of extensions, using the file types reported by a single directory read.
+    """
+    subdirectories = []
+    files = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                subdirectories.append(entry)
+            elif entry.name.endswith(extensions):
+                files.append(entry)
+    return subdirectories, files
+
+
+def generate_navigation_links(input_dir, parsed=None):
+    # Generate Navigation Links for the whole tree under input_dir, recording
+    # each file's parsed front matter and content in parsed (keyed by path)
+    # so it need not be read again
+    navigation_links_list = []
+    for dirpath, dirnames, filenames in os.walk(input_dir):
+        for filename in filenames:
+            if not filename.endswith(('.md', '.markdown')):
+                continue
+
+            input_file_path = os.path.join(dirpath, filename)
+            base_filename = os.path.splitext(filename)[0]
+            # Links are relative to input_dir, whichever directory the page is in
+            output_html_path = os.path.relpath(
+                os.path.join(dirpath, base_filename + '.html'), input_dir
+            ).replace(os.sep, '/')
+
+            raw_text = read_text(input_file_path)
+
+            metadata, markdown_content = parse_front_matter(raw_text)
+            if parsed is not None:
+                parsed[input_file_path] = (metadata, markdown_content)
+            page_name = metadata['title']
+            if metadata['navmenu'] == True:
+                page_order = metadata['navorder']
+                navigation_links_list.append({
+                    'html_file': output_html_path,
+                    'page_name': page_name,
+                    'page_order': page_order
+                })
+    navigation_links_list.sort(key=lambda item: item['page_order'])
+    return navigation_links_list
 
-        input_file_path = os.path.join(input_dir, filename)
-        base_filename = os.path.splitext(filename)[0]
-        output_html_path = os.path.join(base_filename + '.html')
 
-        with open(input_file_path, 'r', encoding='utf-8') as f:
-            raw_text = f.read()
+@functools.lru_cache(maxsize=None)
+def ref_prefix_for_depth(depth):
+    """
+    Returns the relative prefix from a page depth directories below the
+    site root back up to it, building each distinct prefix only once.
+    """
+    return './' + '../' * depth
 
-        metadata, markdown_content = parse_front_matter(raw_text)
-        page_name = metadata['title']
-        if metadata['navmenu'] == True:
-            page_order = metadata['navorder']
-            navigation_links_list.append({
-                'html_file': output_html_path,
-                'page_name': page_name,
-                'page_order': page_order
-            })
-    navigation_links_list.sort(key=lambda item: item['page_order'])
-    return navigation_links_list
+
+def build_navigation_items(navigation_links_list, ref_prefix):
+    """
+    Prebuilds the plain and active <li> markup for every navigation link,
+    so each page only has to pick one of the two.
+    """
+    navigation_items = []
+    for navigation_link in navigation_links_list:
+        href = navigation_link['html_file']
+        page_name = navigation_link['page_name']
+        navigation_items.append((
+            page_name,
+            f'\n\t\t\t\t\t\t<li><a href="{ref_prefix}{href}">{page_name}</a></li>',
+            f'\n\t\t\t\t\t\t<li><a href="{ref_prefix}{href}" class="active">{page_name}</a></li>'
+        ))
+    return navigation_items
+
+
+def build_fingerprint(navigation_links_list, md_engine):
+    """
+    Hashes the navigation links and the Markdown engine tag, so a build can
+    tell when either has changed since the last one.
+    """
+    serialized = json.dumps([md_engine, navigation_links_list], sort_keys=True)
+    return hashlib.blake2b(serialized.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def read_fingerprint(path):
+    try:
+        return read_text(path).strip()
+    except FileNotFoundError:
+        return None
+
+
+def remove_fingerprint(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def write_fingerprint(path, fingerprint):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(fingerprint)
+
+
+def render_navigation_links(navigation_items, title):
+    return ''.join(
+        active_item if page_name == title else item
+        for page_name, item, active_item in navigation_items
+    )
+
+
+def load_template(template_path):
+    """
+    Returns the compiled template at template_path, recompiling it only
+    when the file has changed since it was last read.
+    """
+    mtime = os.path.getmtime(template_path)
+    cached = _template_cache.get(template_path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    template = Template(read_text(template_path))
+    _template_cache[template_path] = (mtime, template)
+    return template
 
 
 def generate_containers_markdown(containers_path):
+    """
+    Returns the containers HTML for containers_path, reusing an earlier
+    result while neither the directory nor any of its files has changed.
+    """
 
     if not os.path.isdir(containers_path):
         print(f"Error: Containers directory '{containers_path}' not found.")
         return
 
-    print("\n--- Generating Containers HTML ---")
+    # The directory mtime covers containers being added or removed
+    _, markdown_files = scan_directory(containers_path, ('.md', '.markdown'))
+    latest_mtime_ns = max(
+        [os.stat(containers_path).st_mtime_ns] + [entry.stat().st_mtime_ns for entry in markdown_files]
+    )
+    return _generate_containers_markdown(containers_path, latest_mtime_ns)
 
-    containers_markdown = ''
-    filter_groups = []
-    filter_buttons = [f'\n\t\t\t\t<button class="filter-btn active" data-filter="all">All</button>']
-    containers = []
 
-    for filename in os.listdir(containers_path):
-        if not filename.endswith(('.md', '.markdown')):
-            continue
+@functools.lru_cache(maxsize=64)
+def _generate_containers_markdown(containers_path, latest_mtime_ns):
 
-        input_file_path = os.path.join(containers_path, filename)
+    print("\n--- Generating Containers HTML ---")
 
-        with open(input_file_path, 'r', encoding='utf-8') as f:
-            raw_text = f.read()
+    filter_groups = set()
+    containers = []
+
+    _, markdown_files = scan_directory(containers_path, ('.md', '.markdown'))
+    for entry in markdown_files:
+        raw_text = read_text(entry.path)
 
         metadata, markdown_content = parse_front_matter(raw_text)
 
@@ -110,151 +527,294 @@ def generate_containers_markdown(containers_path):
         container_link = metadata['containerlink']
         container_title = metadata['containertitle']
 
-        for container_group in container_groups:
-            if container_group not in filter_groups:
-                filter_groups.append(container_group)
+        filter_groups.update(container_groups)
 
-        container_groups_dq = json.dumps(container_groups)
+        container_groups_dq = _compact_json_encoder.encode(container_groups)
         containers.append(f"\n\t\t\t\t<div class='item' data-groups='{container_groups_dq}'>\n\t\t\t\t\t<a href='{container_link}'>\n\t\t\t\t\t\t<img src='{container_image}' alt='{container_alttext}'  class='item_img'>\n\t\t\t\t\t\t<div class='item_overlay'>\n\t\t\t\t\t\t\t<div class='item_text'>\n\t\t\t\t\t\t\t\t<h3>{container_title}</h3>\n\t\t\t\t\t\t\t\t<p>{container_title}</p>\n\t\t\t\t\t\t\t</div>\n\t\t\t\t\t\t</div>\n\t\t\t\t\t</a>\n\t\t\t\t</div>")
 
-    filter_groups.sort()
-    for filter_group in filter_groups:
-        filter_buttons.append(f'\n\t\t\t\t<button class="filter-btn" data-filter="{filter_group}">{filter_group}</button>')
+    # Collect every fragment in one list and join once at the end
+    containers_parts = [
+        '\n\t\t\t<div class="filter-buttons">',
+        '\n\t\t\t\t<button class="filter-btn active" data-filter="all">All</button>'
+    ]
+    for filter_group in sorted(filter_groups):
+        containers_parts.append(f'\n\t\t\t\t<button class="filter-btn" data-filter="{filter_group}">{filter_group}</button>')
+    containers_parts.append('\n\t\t\t</div>')
+    containers_parts.append('\n\t\t\t<div class="items-container">')
+    containers_parts.extend(containers)
+    containers_parts.append('\n\t\t\t</div>')
 
-    containers_markdown = '\n\t\t\t<div class="filter-buttons">' + "".join(filter_buttons) + '\n\t\t\t</div>' + '\n\t\t\t<div class="items-container">' + "".join(containers) + '\n\t\t\t</div>'
+    return ''.join(containers_parts)
 
-    return containers_markdown
+
+def _is_up_to_date(target_path, source_paths):
+    """
+    Returns True when target_path exists and is newer than every source.
+    """
+    try:
+        target_mtime = os.stat(target_path).st_mtime
+        return all(os.stat(path).st_mtime < target_mtime for path in source_paths)
+    except FileNotFoundError:
+        return False
 
 
-def generate_data(input_dir, json_dir, navigation_links_list, ref_prefix):
+def read_text(path):
     """
-    Processes Markdown files from input_dir, converts their content to
-    HTML, and saves everything as structured JSON files in json_dir.
+    Reads a UTF-8 text file with os-level calls, which for small files is
+    much cheaper than a buffered text-mode open(). Newlines are translated
+    the same way text mode would.
     """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        while chunk := os.read(fd, 65536):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
 
-    if not os.path.isdir(input_dir):
-        print(f"Error: Input directory '{input_dir}' not found.")
-        return
+    text = b''.join(chunks).decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
 
-    create_missing_directory(json_dir)
 
-    print("\n--- Generating Data from Markdown ---")
+def write_file(path, data):
+    """
+    Writes bytes to path with unbuffered os-level calls. There is no fsync;
+    a build interrupted by a crash is simply run again.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
-    navigation_links_list = generate_navigation_links(input_dir, navigation_links_list)
 
-    for filename in os.listdir(input_dir):
-        if os.path.isdir(os.path.join(input_dir, filename)):
-            print(f"Subdirectory found: '{filename}'")
-            generate_data(
-                os.path.join(input_dir, filename),
-                os.path.join(json_dir, filename),
-                navigation_links_list,
-                ref_prefix + '../'
-            )
+def write_files(outputs):
+    """
+    Flushes a batch of (path, bytes) outputs, one directory at a time.
+    """
+    for path, data in sorted(outputs, key=lambda output: (os.path.dirname(output[0]), output[0])):
+        write_file(path, data)
 
-        if not filename.endswith(('.md', '.markdown')):
-            continue
 
-        input_file_path = os.path.join(input_dir, filename)
-        base_filename = os.path.splitext(filename)[0]
-        output_json_path = os.path.join(json_dir, base_filename + '.json')
+def _page_sources(input_file_path, page_data):
+    """
+    Lists the files a page is built from: its Markdown source and, for
+    containers layouts, the containers directory and its files.
+    """
+    sources = [input_file_path]
+    if page_data.get('layout') == 'containers':
+        containers_path = os.path.dirname(input_file_path) + '/' + page_data['containerspath']
+        if os.path.isdir(containers_path):
+            # The directory mtime covers containers being added or removed
+            _, markdown_files = scan_directory(containers_path, ('.md', '.markdown'))
+            sources.append(containers_path)
+            sources.extend(entry.path for entry in markdown_files)
+    return sources
+
+
+def _process_markdown_file(input_file_path, output_dir, md_cache_dir, navigation_items, ref_prefix,
+                           parsed_page=None, json_dir=None):
+    """
+    Converts a single Markdown file to its page data, also saving it as
+    JSON in json_dir if given. parsed_page is the (metadata, content) pair
+    if the file has already been parsed. Returns the output HTML path, the
+    page data, its source files and the log line for the caller to print.
+    """
+    filename = os.path.basename(input_file_path)
+    base_filename = os.path.splitext(filename)[0]
+    output_html_path = os.path.join(output_dir, base_filename + '.html')
 
-        with open(input_file_path, 'r', encoding='utf-8') as f:
-            raw_text = f.read()
+    if parsed_page is None:
+        raw_text = read_text(input_file_path)
+        parsed_page = parse_front_matter(raw_text)
 
-        metadata, markdown_content = parse_front_matter(raw_text)
-        html_content = markdown.markdown(markdown_content)
+    metadata, markdown_content = parsed_page
+    html_content = render_markdown(markdown_content, md_cache_dir)
+
+    # The final data object handed to the template
+    page_data = metadata
+    page_data['page_markdown'] = html_content
+    page_data['navigation_links'] = render_navigation_links(navigation_items, page_data['title'])
+    page_data['ref_prefix'] = ref_prefix
 
-        # The final data object to be saved as JSON
-        page_data = metadata
-        page_data['page_markdown'] = html_content
-        navigation_links = ''
-        for navigation_link in navigation_links_list:
-            href = navigation_link['html_file']
-            page_name = navigation_link['page_name']
-            a_class = f' class="active"' if page_name == page_data['title'] else ''
-            navigation_links += f'\n\t\t\t\t\t\t<li><a href="{ref_prefix}{href}"{a_class}>{page_name}</a></li>'
-        page_data['navigation_links'] = navigation_links
+    if page_data['layout'] == 'containers':
+        page_data['containers_markdown'] = generate_containers_markdown(
+            os.path.dirname(input_file_path) + '/' + page_data['containerspath']
+        )
 
-        if page_data['layout'] == 'containers':
-            page_data['containers_markdown'] = generate_containers_markdown(
-                input_dir + '/' + page_data['containerspath']
-            )
+    sources = _page_sources(input_file_path, page_data)
 
-        with open(output_json_path, 'w', encoding='utf-8') as f:
-            json.dump(page_data, f, indent=4)
-        print(f"Generated data for '{filename}' -> '{output_json_path}'")
+    if json_dir is None:
+        return output_html_path, page_data, sources, f"Generated data for '{filename}'"
 
+    output_json_path = os.path.join(json_dir, base_filename + '.json')
+    write_file(output_json_path, _dumps(page_data))
+    return output_html_path, page_data, sources, f"Generated data for '{filename}' -> '{output_json_path}'"
 
-def render_site(json_dir, template_dir, output_dir, ref_prefix):
+
+def generate_data(input_dir, output_dir, md_cache_dir, navigation_links_list, depth, executor, parsed=None,
+                  json_dir=None):
     """
-    Reads JSON data files, applies the corresponding template,
-    and renders the final HTML files to the output_dir.
+    Processes Markdown files from input_dir and converts their content to
+    HTML, returning (output HTML path, page data, sources) for every page
+    to be rendered under output_dir, which is depth directories below the
+    site root. The page data is also saved as JSON files in json_dir if
+    given.
+    navigation_links_list and parsed come from generate_navigation_links.
+    Files are converted concurrently on executor.
     """
 
-    if not os.path.isdir(template_dir):
-        print(f"Error: HTML Template directory '{template_dir}' not found.")
-        return
+    if not os.path.isdir(input_dir):
+        print(f"Error: Input directory '{input_dir}' not found.")
+        return []
 
-    if not os.path.isdir(json_dir):
-        print(f"Error: JSON data directory '{json_dir}' not found.")
-        return
+    if json_dir is not None:
+        create_missing_directory(json_dir)
 
-    create_missing_directory(output_dir)
+    print("\n--- Generating Data from Markdown ---")
 
-    print("\n--- Rendering Site from JSON Data ---")
-    for filename in os.listdir(json_dir):
+    if parsed is None:
+        parsed = {}
+
+    # Built once per directory and only read by the workers
+    ref_prefix = ref_prefix_for_depth(depth)
+    navigation_items = build_navigation_items(navigation_links_list, ref_prefix)
+    subdirectories, markdown_files = scan_directory(input_dir, ('.md', '.markdown'))
+
+    futures = [
+        executor.submit(
+            _process_markdown_file,
+            entry.path,
+            output_dir,
+            md_cache_dir,
+            navigation_items,
+            ref_prefix,
+            parsed.get(entry.path),
+            json_dir
+        )
+        for entry in markdown_files
+    ]
+    pages = []
+    for future in as_completed(futures):
+        output_html_path, page_data, sources, message = future.result()
+        pages.append((output_html_path, page_data, sources))
+        print(message)
+
+    for entry in subdirectories:
+        print(f"Subdirectory found: '{entry.name}'")
+        pages.extend(generate_data(
+            entry.path,
+            os.path.join(output_dir, entry.name),
+            md_cache_dir,
+            navigation_links_list,
+            depth + 1,
+            executor,
+            parsed,
+            None if json_dir is None else os.path.join(json_dir, entry.name)
+        ))
+
+    return pages
+
+
+def _render_page(output_html_path, page_data, sources, template_dir, force):
+    """
+    Renders a single page's data through its template to HTML, unless
+    force is False and the HTML is newer than its sources and template.
+    Returns the encoded HTML (None if nothing needs writing), whether the
+    page is now current, and the log line for the caller to print.
+    """
+    filename = os.path.basename(sources[0])
 
-        if os.path.isdir(os.path.join(json_dir, filename)):
-            print(f"Subdirectory found: '{filename}'")
-            render_site(
-                os.path.join(json_dir, filename),
-                template_dir,
-                os.path.join(output_dir, filename),
-                ref_prefix + '../'
-            )
+    template_name = page_data.get('layout', 'page') + '.html'
+    template_path = os.path.join(template_dir, template_name)
 
-        if not filename.endswith('.json'):
-            continue
+    if not force and _is_up_to_date(output_html_path, sources + [template_path]):
+        return None, True, f"Skipped unchanged '{filename}'"
 
-        json_file_path = os.path.join(json_dir, filename)
-        base_filename = os.path.splitext(filename)[0]
-        output_html_path = os.path.join(output_dir, base_filename + '.html')
+    try:
+        template = load_template(template_path)
+    except FileNotFoundError:
+        return None, False, f"Warning: Template '{template_name}' not found for '{filename}'. Skipping."
 
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            page_data = json.load(f)
+    if 'title' not in page_data:
+        page_data['title'] = 'Untitled'
+    if 'page_markdown' not in page_data:
+        page_data['page_markdown'] = ''
 
-        template_name = page_data.get('layout', 'page') + '.html'
-        template_path = os.path.join(template_dir, template_name)
+    try:
+        final_html = template.substitute(page_data)
+    except KeyError as e:
+        return None, False, f"Warning: Missing key {e} in data for '{filename}'. Skipping."
 
-        try:
-            with open(template_path, 'r', encoding='utf-8') as f:
-                template = Template(f.read())
-        except FileNotFoundError:
-            print(f"Warning: Template '{template_name}' not found for '{filename}'. Skipping.")
-            continue
+    return final_html.encode('utf-8'), True, f"Rendered '{filename}' -> '{output_html_path}'"
 
-        if 'title' not in page_data:
-            page_data['title'] = 'Untitled'
-        if 'page_markdown' not in page_data:
-            page_data['page_markdown'] = ''
-        page_data['ref_prefix'] = ref_prefix
 
-        try:
-            final_html = template.substitute(page_data)
-        except KeyError as e:
-            print(f"Warning: Missing key {e} in data for '{filename}'. Skipping.")
-            continue
+def render_site(pages, template_dir, executor, force=False):
+    """
+    Applies the corresponding template to each page from generate_data
+    and renders the final HTML files.
+    Pages are rendered concurrently on executor and written out together
+    at the end; unchanged pages are skipped unless force is set.
+    Returns True only if every page was rendered or already up to date.
+    """
+
+    if not os.path.isdir(template_dir):
+        print(f"Error: HTML Template directory '{template_dir}' not found.")
+        return False
 
-        with open(output_html_path, 'w', encoding='utf-8') as f:
-            f.write(final_html)
-        print(f"Rendered '{filename}' -> '{output_html_path}'")
+    for output_dir in sorted({os.path.dirname(output_html_path) for output_html_path, _, _ in pages}):
+        create_missing_directory(output_dir)
 
-    # for dirname in os.listdir(json_dir):
-    #         if os.path.isdir(os.path.join(path, name))]
+    print("\n--- Rendering Site from Page Data ---")
+
+    futures = {
+        executor.submit(_render_page, output_html_path, page_data, sources, template_dir, force): output_html_path
+        for output_html_path, page_data, sources in pages
+    }
+    outputs = []
+    complete = True
+    for future in as_completed(futures):
+        html, current, message = future.result()
+        if html is not None:
+            outputs.append((futures[future], html))
+        complete = complete and current
+        print(message)
+
+    write_files(outputs)
+    return complete
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Generate the static site from Markdown pages.')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Number of files to process concurrently.')
+    parser.add_argument('--processes', action='store_true',
+                        help='Use worker processes instead of threads, for Markdown-heavy sites.')
+    parser.add_argument('--force', action='store_true',
+                        help='Regenerate every page, even those that look unchanged.')
+    parser.add_argument('--clear-cache', action='store_true',
+                        help='Empty the Markdown conversion cache before building.')
+    parser.add_argument('--emit-json', action='store_true',
+                        help='Also save each page\'s data as JSON, for debugging.')
+    parser.add_argument('--yaml-front-matter', action='store_true',
+                        help='Parse all \'---\' front matter with PyYAML rather than the built-in simple parser.')
+    parser.add_argument('--markdown-engine', choices=MARKDOWN_ENGINES, default='markdown',
+                        help='Markdown renderer to use; mistune and cmarkgfm are faster but optional.')
+    parser.add_argument('--static-mode', choices=['copy', 'hardlink', 'symlink'], default='copy',
+                        help='How static assets are placed in the output directory.')
+    args = parser.parse_args()
+
+    global USE_YAML_FRONT_MATTER, _render_md, MD_ENGINE
+    USE_YAML_FRONT_MATTER = args.yaml_front_matter
+    try:
+        _render_md, MD_ENGINE = load_markdown_engine(args.markdown_engine)
+    except ImportError as e:
+        parser.error(f"Markdown engine '{args.markdown_engine}' is not usable: {e}")
+
     # The script is in 'src', so the project root is one level up.
     src_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.dirname(src_dir)
@@ -265,13 +825,44 @@ def main():
     input_directory = os.path.join(project_root, '_data/pages')
     images_directory = os.path.join(project_root, '_data/pages/images')
     json_directory = os.path.join(project_root, '_data/working/page_json')
+    md_cache_directory = os.path.join(project_root, '_data/working/md_cache')
+    nav_fingerprint_path = os.path.join(project_root, '_data/working/nav_fingerprint')
     template_directory = os.path.join(project_root, '_data/assets/templates')
     output_directory = os.path.join(project_root, 'docs')
 
+    if args.clear_cache:
+        clear_cache(md_cache_directory)
+    else:
+        create_missing_directory(md_cache_directory)
+
+    # Threads suit the file I/O; processes sidestep the GIL when
+    # Markdown rendering dominates.
+    if args.processes:
+        executor = ProcessPoolExecutor(max_workers=args.jobs or os.cpu_count())
+    else:
+        executor = ThreadPoolExecutor(max_workers=args.jobs or min(32, (os.cpu_count() or 1) * 4))
+
     # Run all stages
-    generate_data(input_directory, json_directory, [], './')
-    render_site(json_directory, template_directory, output_directory, './')
-    copy_static_assets([css_directory, scripts_directory, images_directory], output_directory)
+    parsed_pages = {}
+    navigation_links_list = generate_navigation_links(input_directory, parsed_pages)
+
+    # Every page embeds the navigation and is rendered by the same Markdown
+    # engine, so a change to either rebuilds them all
+    nav_fingerprint = build_fingerprint(navigation_links_list, MD_ENGINE)
+    force = args.force or read_fingerprint(nav_fingerprint_path) != nav_fingerprint
+
+    with executor:
+        pages = generate_data(input_directory, output_directory, md_cache_directory, navigation_links_list, 0,
+                              executor, parsed_pages, json_directory if args.emit_json else None)
+        rendered = render_site(pages, template_directory, executor, force)
+
+    # Only a complete render may record the fingerprint as built; otherwise
+    # drop the old record so the next run rebuilds every page
+    if rendered:
+        write_fingerprint(nav_fingerprint_path, nav_fingerprint)
+    else:
+        remove_fingerprint(nav_fingerprint_path)
+    copy_static_assets([css_directory, scripts_directory, images_directory], output_directory, args.static_mode)
 
     print("\nSite generation complete!")
 